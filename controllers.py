@@ -1,17 +1,13 @@
 # controllers.py
 # Manages the application logic, state, and connects views with models.
 
-import sys
-import json
 import logging
-import os
 from PyQt6.QtWidgets import QMessageBox
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
+from PyQt6.QtCore import QObject, QTimer
 from models import DatabaseManager, WishlistManager, DataWorker
 from views import MainView, AuthDialog, PetDetailsDialog, AdoptionFormDialog, ServiceDetailsDialog, ScheduleDialog, ConfirmationDialog
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 class AppController(QObject):
     """
@@ -39,6 +35,16 @@ class AppController(QObject):
         'booking_track': ["Home", "Browse Services", "Service Details", "Schedule", "Booking Form", "Payment", "Confirmation"]
     }
     
+    # Breadcrumb steps and index of the last step for each flow, computed once
+    FLOW_TRACKS = {
+        'adoption': (BREADCRUMBS['adoption_track'], len(BREADCRUMBS['adoption_track']) - 1),
+        'booking': (BREADCRUMBS['booking_track'], len(BREADCRUMBS['booking_track']) - 1),
+    }
+    HOME_TRACK = (["Home"], None)
+
+    # Delay after the last keystroke before a search-as-you-type query runs
+    SEARCH_DEBOUNCE_MS = 200
+    
     def __init__(self, view: MainView, db: DatabaseManager, wishlist_manager: WishlistManager):
         super().__init__()
         self.view = view
@@ -46,6 +52,7 @@ class AppController(QObject):
         self.wishlist_manager = wishlist_manager
         
         self.user_id = None
+        self.user = None # Details of the logged-in user, fetched once at login
         self.username = "Guest"
         self.current_state = self.STATES['guest_home']
         self.current_flow = None # 'adoption' or 'booking'
@@ -53,90 +60,129 @@ class AppController(QObject):
         
         self.pending_action = None
         
-        self.data_worker = None
+        # Worker result type -> handler, built once so each result costs one lookup
+        self._result_handlers = {
+            'pets_list': self.on_pets_loaded,
+            'services_list': self.on_services_loaded,
+            'home_payload': self.on_home_payload_loaded,
+            'auth_result': self.on_login_result,
+            'signup_result': self.on_signup_result,
+            'wishlist_synced': self.on_wishlist_synced,
+        }
+        
+        # Password hashing gets its own worker so a slow Argon2 call never queues ahead of catalog reads
+        self.data_worker = self.start_worker()
+        self.auth_worker = self.start_worker()
         
         self.connect_signals()
         self.update_ui_for_state()
 
-        # Initial data load
-        self.load_pet_data()
-        self.load_service_data()
+        # Initial data load: pets and services in one worker job
+        self.run_in_worker('get_home_payload')
         
     def connect_signals(self):
         """Connects signals from the view to controller slots."""
-        self.view.home_view.findChild(QPushButton, "See All Pets").clicked.connect(self.show_pet_list)
-        self.view.home_view.findChild(QPushButton, "See All Services").clicked.connect(self.show_service_list)
-        self.view.pet_list_view.findChild(QPushButton, "Search").clicked.connect(self.on_pet_search)
-        self.view.service_list_view.findChild(QPushButton, "Search").clicked.connect(self.on_service_search)
-        self.view.auth_button.clicked.connect(self.show_auth_dialog)
+        # Use the view's widget references directly rather than walking the widget tree with findChild
+        self.view.see_all_pets_btn.clicked.connect(self.show_pet_list)
+        self.view.see_all_services_btn.clicked.connect(self.show_service_list)
+        self.view.pet_search_clicked.connect(self.on_pet_search)
+        self.view.service_search_clicked.connect(self.on_service_search)
+        self.view.navigate_to_pet_details.connect(self.on_pet_card_click)
+        self.view.navigate_to_service_details.connect(self.on_service_card_click)
+        self.view.auth_button.clicked.connect(self._on_auth_button)
 
-    def load_pet_data(self):
-        """Fetches pet data from the database in a separate thread."""
-        self.start_worker_thread('get_pets')
-        
-    def load_service_data(self):
-        """Fetches service data from the database in a separate thread."""
-        self.start_worker_thread('get_services')
+        # Search as the user types, but only once typing pauses
+        self.pet_search_timer = self.create_debounce_timer(self.on_pet_search)
+        self.service_search_timer = self.create_debounce_timer(self.on_service_search)
+        self.view.pet_search_text_changed.connect(lambda text: self.pet_search_timer.start())
+        self.view.service_search_text_changed.connect(lambda text: self.service_search_timer.start())
+
+    def create_debounce_timer(self, slot):
+        """Creates a single-shot timer that calls slot once SEARCH_DEBOUNCE_MS pass without a restart."""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        timer.timeout.connect(slot)
+        return timer
 
-    def start_worker_thread(self, operation, **kwargs):
-        """Starts a DataWorker thread for a given operation."""
-        if self.data_worker and self.data_worker.isRunning():
-            return
+    def load_pet_data(self, query=""):
+        """Fetches pet data in the worker thread; repeated queries are served from the database's catalog cache."""
+        self.run_in_worker('get_pets', query=query)
         
-        self.data_worker = DataWorker(self.db, operation, **kwargs)
-        self.data_worker.result_ready.connect(self.handle_worker_result)
-        self.data_worker.error_occurred.connect(self.handle_worker_error)
-        self.data_worker.finished.connect(self.on_worker_finished)
-        self.data_worker.start()
+    def load_service_data(self, query=""):
+        """Fetches service data in the worker thread; repeated queries are served from the database's catalog cache."""
+        self.run_in_worker('get_services', query=query)
+
+    def start_worker(self):
+        """Creates and starts a DataWorker whose results and errors go to the controller's handlers."""
+        worker = DataWorker(self.db)
+        worker.result_ready.connect(self.handle_worker_result)
+        worker.error_occurred.connect(self.handle_worker_error)
+        worker.start()
+        return worker
+
+    def run_in_worker(self, operation, **kwargs):
+        """Queues an operation on a background DataWorker thread."""
+        worker = self.auth_worker if operation in DataWorker.PASSWORD_OPERATIONS else self.data_worker
+        worker.submit(operation, **kwargs)
+
+    def shutdown(self):
+        """Stops the worker threads and closes the database."""
+        for worker in (self.data_worker, self.auth_worker):
+            worker.stop()
+        for worker in (self.data_worker, self.auth_worker):
+            worker.wait()
+        self.db.close()
         
     def handle_worker_result(self, result_type, data):
         """Handles results from the DataWorker thread."""
-        if result_type == 'pets_list':
-            self.view.display_pets(data)
-        elif result_type == 'services_list':
-            self.view.display_services(data)
-        elif result_type == 'auth_result':
-            self.on_login_result(data)
-        elif result_type == 'signup_result':
-            self.on_signup_result(data)
-        elif result_type == 'wishlist_result':
-            # Handle syncing the wishlist on login
-            if self.pending_action == 'sync_wishlist' and data:
-                for pet in data:
-                    self.db.add_to_wishlist(self.user_id, pet['id'])
-                os.remove(self.wishlist_manager.filename)
-                self.pending_action = None
-            
+        handler = self._result_handlers.get(result_type)
+        if handler:
+            handler(data)
+
+    def on_pets_loaded(self, pets):
+        """Displays a pet list fetched by the worker."""
+        self.view.display_pets(pets)
+
+    def on_services_loaded(self, services):
+        """Displays a service list fetched by the worker."""
+        self.view.display_services(services)
+
+    def on_home_payload_loaded(self, data):
+        """Displays the startup pet and service lists."""
+        self.view.display_pets(data['pets'])
+        self.view.display_services(data['services'])
+
+    def on_wishlist_synced(self, success):
+        """Clears the guest wishlist once it has been synced, or keeps it for the next login if the sync failed."""
+        if success:
+            self.wishlist_manager.clear()
+            self.view.toast("Your guest wishlist has been synced to your account!")
+        else:
+            logger.warning("Guest wishlist sync failed; keeping it for the next login.")
+
     def handle_worker_error(self, operation, error_msg):
         """Handles errors from the DataWorker thread."""
-        logging.error(f"Worker thread for '{operation}' failed: {error_msg}")
+        logger.error("Worker thread for '%s' failed: %s", operation, error_msg)
         QMessageBox.warning(self.view, "Database Error", "An error occurred while accessing the database.")
 
-    def on_worker_finished(self):
-        """Cleans up the worker thread."""
-        self.data_worker = None
-        
     def update_ui_for_state(self):
         """Updates UI elements based on the current state."""
-        self.view.progress_frame.setVisible(self.current_state > self.STATES['guest_home'])
+        steps_done = self.current_state - self.STATES['guest_home']
+        self.view.progress_frame.setVisible(steps_done > 0)
 
-        if self.current_flow == 'adoption':
-            steps = self.BREADCRUMBS['adoption_track']
-            progress_percent = int((self.current_state - self.STATES['guest_home']) / (len(steps) - 1) * 100)
-        elif self.current_flow == 'booking':
-            steps = self.BREADCRUMBS['booking_track']
-            progress_percent = int((self.current_state - self.STATES['guest_home']) / (len(steps) - 1) * 100)
-        else:
-            steps = ["Home"]
-            progress_percent = 0
+        steps, last_step = self.FLOW_TRACKS.get(self.current_flow, self.HOME_TRACK)
+        progress_percent = 100 * steps_done // last_step if last_step else 0
             
         self.view.breadcrumbs.set_steps(steps)
         self.view.progress_bar.setValue(progress_percent)
 
         self.view.user_label.setText(self.username)
         self.view.auth_button.setText("Logout" if self.user_id else "Login / Signup")
-        self.view.auth_button.clicked.disconnect()
-        self.view.auth_button.clicked.connect(self.logout if self.user_id else self.show_auth_dialog)
+
+    def _on_auth_button(self):
+        """Logs out a signed-in user, or opens the authentication dialog for a guest."""
+        (self.logout if self.user_id else self.show_auth_dialog)()
 
     def on_pet_card_click(self, pet_data):
         """Handles click on a pet card."""
@@ -160,51 +206,57 @@ class AppController(QObject):
         dialog.book_service.connect(self.on_book_click)
         dialog.exec()
         
+    def get_auth_dialog(self):
+        """Returns the shared authentication dialog, creating and wiring it on first use."""
+        if self.view.auth_dialog is None:
+            self.view.auth_dialog = AuthDialog(self.view)
+            self.view.auth_dialog.login_attempt.connect(self.on_login_attempt)
+            self.view.auth_dialog.signup_attempt.connect(self.on_signup_attempt)
+        else:
+            self.view.auth_dialog.clear_inputs()
+        return self.view.auth_dialog
+
     def show_auth_dialog(self):
         """Displays the authentication dialog."""
-        dialog = AuthDialog(self.view)
-        dialog.login_attempt.connect(self.on_login_attempt)
-        dialog.signup_attempt.connect(self.on_signup_attempt)
-        dialog.exec()
+        self.get_auth_dialog().exec()
         
     def on_login_attempt(self, username, password):
         """Initiates a login attempt."""
-        self.start_worker_thread('verify_user', username=username, password=password)
+        self.run_in_worker('verify_user', username=username, password=password)
         
-    def on_login_result(self, user_id):
+    def on_login_result(self, user):
         """Handles the result of a login attempt."""
-        if user_id:
-            self.user_id = user_id
-            self.username = self.db.get_user_by_id(user_id)['username']
-            QMessageBox.information(self.view, "Success", f"Welcome back, {self.username}!")
+        if user:
+            self.user = user
+            self.user_id = user['id']
+            self.username = user['username']
+            self.view.toast(f"Welcome back, {self.username}!")
             self.update_ui_for_state()
             self.view.auth_dialog.accept()
-            # If there's a pending action, redirect to it
-            if self.pending_action == 'adopt':
-                self.show_adoption_form()
-            elif self.pending_action == 'book':
-                self.show_schedule_dialog()
-            # Check for guest wishlist to sync
-            if os.path.exists(self.wishlist_manager.filename):
-                self.pending_action = 'sync_wishlist'
-                guest_wishlist = self.wishlist_manager.load_wishlist()
-                if guest_wishlist:
-                    for pet_id in guest_wishlist:
-                        self.db.add_to_wishlist(self.user_id, pet_id)
-                    os.remove(self.wishlist_manager.filename)
-                    QMessageBox.information(self.view, "Wishlist Synced", "Your guest wishlist has been synced to your account!")
+            # If there's a pending action, redirect to it, once. The login dialog may have been
+            # dismissed and reopened since, so only if its pet or service is still selected.
+            action, self.pending_action = self.pending_action, None
+            if self.current_item is not None:
+                if action == 'adopt':
+                    self.show_adoption_form()
+                elif action == 'book':
+                    self.show_schedule_dialog()
+            # Sync the guest wishlist, if any, to the account. It is only cleared once the sync succeeds.
+            guest_wishlist = self.wishlist_manager.load_wishlist()
+            if guest_wishlist:
+                self.run_in_worker('bulk_add_wishlist', user_id=self.user_id, pet_ids=guest_wishlist)
 
         else:
             self.view.auth_dialog.login_error_label.setText("Invalid username or password.")
             
     def on_signup_attempt(self, username, email, password):
         """Initiates a signup attempt."""
-        self.start_worker_thread('add_user', username=username, email=email, password=password)
+        self.run_in_worker('add_user', username=username, email=email, password=password)
         
     def on_signup_result(self, success):
         """Handles the result of a signup attempt."""
         if success:
-            QMessageBox.information(self.view, "Success", "Account created! Please log in.")
+            self.view.toast("Account created! Please log in.")
             self.view.auth_dialog.tab_widget.setCurrentIndex(0) # Switch to login tab
         else:
             self.view.auth_dialog.signup_error_label.setText("Username or email already exists.")
@@ -212,22 +264,21 @@ class AppController(QObject):
     def logout(self):
         """Logs the current user out."""
         self.user_id = None
+        self.user = None
         self.username = "Guest"
         self.current_state = self.STATES['guest_home']
         self.current_flow = None
         self.current_item = None
+        self.pending_action = None
         self.view.show_home_view()
         self.update_ui_for_state()
-        QMessageBox.information(self.view, "Logged Out", "You have been logged out.")
+        self.view.toast("You have been logged out.")
         
     def on_adopt_click(self, pet_data):
         """Handles the 'Adopt' button click, checks for auth."""
         if not self.user_id:
             self.pending_action = 'adopt'
-            self.view.auth_dialog = AuthDialog(self.view)
-            self.view.auth_dialog.login_attempt.connect(self.on_login_attempt)
-            self.view.auth_dialog.signup_attempt.connect(self.on_signup_attempt)
-            self.view.auth_dialog.exec()
+            self.show_auth_dialog()
         else:
             self.show_adoption_form()
     
@@ -235,10 +286,7 @@ class AppController(QObject):
         """Handles the 'Book' button click, checks for auth."""
         if not self.user_id:
             self.pending_action = 'book'
-            self.view.auth_dialog = AuthDialog(self.view)
-            self.view.auth_dialog.login_attempt.connect(self.on_login_attempt)
-            self.view.auth_dialog.signup_attempt.connect(self.on_signup_attempt)
-            self.view.auth_dialog.exec()
+            self.show_auth_dialog()
         else:
             self.show_schedule_dialog()
 
@@ -253,29 +301,35 @@ class AppController(QObject):
     def on_adoption_form_submitted(self, form_data):
         """Handles a completed adoption form."""
         QMessageBox.information(self.view, "Payment", "Payment placeholder. Proceeding to confirmation.")
-        self.db.add_adopted_pet(self.user_id, self.current_item['id'])
+        self.run_in_worker('add_adopted_pet', user_id=self.user_id, pet_id=self.current_item.id)
         self.show_confirmation_dialog("Your adoption application has been submitted successfully!")
 
     def show_schedule_dialog(self):
         """Shows the service scheduling dialog."""
         self.current_state = self.STATES['booking_schedule']
         self.update_ui_for_state()
-        dialog = ScheduleDialog(self.view)
-        dialog.schedule_selected.connect(self.on_schedule_selected)
-        dialog.exec()
+        if self.view.schedule_dialog is None:
+            self.view.schedule_dialog = ScheduleDialog(self.view)
+            self.view.schedule_dialog.schedule_selected.connect(self.on_schedule_selected)
+        else:
+            self.view.schedule_dialog.reset()
+        self.view.schedule_dialog.exec()
         
     def on_schedule_selected(self, date_str):
         """Handles a selected booking date."""
         QMessageBox.information(self.view, "Booking", "Booking form and payment placeholder. Proceeding to confirmation.")
-        self.db.add_booking(self.user_id, self.current_item['id'], date_str)
+        self.run_in_worker('add_booking', user_id=self.user_id, service_id=self.current_item.id, booking_date=date_str)
         self.show_confirmation_dialog("Your service booking is confirmed!")
         
     def show_confirmation_dialog(self, message):
         """Shows the final confirmation dialog."""
         self.current_state = self.STATES['confirmation']
         self.update_ui_for_state()
-        dialog = ConfirmationDialog(message, self.view)
-        dialog.exec()
+        if self.view.confirmation_dialog is None:
+            self.view.confirmation_dialog = ConfirmationDialog(message, self.view)
+        else:
+            self.view.confirmation_dialog.message_label.setText(message)
+        self.view.confirmation_dialog.exec()
         self.reset_to_home()
 
     def reset_to_home(self):
@@ -292,7 +346,6 @@ class AppController(QObject):
         self.current_flow = 'adoption'
         self.update_ui_for_state()
         self.view.show_pet_list_view()
-        self.view.clear_grid_layout(self.view.pet_grid_layout)
         self.load_pet_data()
         
     def show_service_list(self):
@@ -301,29 +354,17 @@ class AppController(QObject):
         self.current_flow = 'booking'
         self.update_ui_for_state()
         self.view.show_service_list_view()
-        self.view.clear_grid_layout(self.view.service_grid_layout)
         self.load_service_data()
         
     def on_pet_search(self):
-        """Handles the pet search button click."""
-        query = self.view.pet_list_view.findChild(QLineEdit).text()
+        """Runs a pet search from the search button or the debounced search box."""
+        self.pet_search_timer.stop()
+        query = self.view.pet_list_view.search_input.text()
         # In a full app, we would also get filters.
-        self.start_worker_thread('get_pets', query=query)
+        self.load_pet_data(query)
         
     def on_service_search(self):
-        """Handles the service search button click."""
-        query = self.view.service_list_view.findChild(QLineEdit).text()
-        self.start_worker_thread('get_services', query=query)
-        
-    def on_home_view_pet_card_clicked(self, event):
-        """Handles clicks on pet cards in the home view's grid."""
-        widget = self.view.pets_section.findChild(QGridLayout).itemAt(0).widget().childAt(event.pos())
-        if isinstance(widget, PetCard):
-            self.on_pet_card_click(widget.pet_data)
-
-    def on_home_view_service_card_clicked(self, event):
-        """Handles clicks on service cards in the home view's grid."""
-        widget = self.view.services_section.findChild(QGridLayout).itemAt(0).widget().childAt(event.pos())
-        if isinstance(widget, ServiceCard):
-            self.on_service_card_click(widget.service_data)
-      
+        """Runs a service search from the search button or the debounced search box."""
+        self.service_search_timer.stop()
+        query = self.view.service_list_view.search_input.text()
+        self.load_service_data(query)
@@ -4,25 +4,27 @@
 import sys
 import os
 import logging
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import QApplication, QMessageBox
 from models import DatabaseManager, WishlistManager
-from views import MainView
+from views import MainView, apply_global_style
 from controllers import AppController
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 def setup_resources():
     """Create placeholder directories and assets if they don't exist."""
-    if not os.path.exists('assets'):
-        os.makedirs('assets')
+    os.makedirs('assets', exist_ok=True)
+    # List the directory once instead of stat()-ing every asset
+    with os.scandir('assets') as entries:
+        existing = {entry.name for entry in entries}
     # Create empty placeholder files to avoid errors
     for i in range(1, 11):
-        if not os.path.exists(f"assets/p{i}.jpg"):
+        if f"p{i}.jpg" not in existing:
             with open(f"assets/p{i}.jpg", 'w') as f:
                 pass
-    logging.info("Assets directory and placeholder files checked.")
+    logger.info("Assets directory and placeholder files checked.")
 
 def main():
     """Main function to run the application."""
@@ -30,29 +32,28 @@ def main():
     
     app = QApplication(sys.argv)
     app.setApplicationName("OnlyPets")
+    apply_global_style(app)
     
     # Check for font (Inter) availability and fallback
     font = app.font()
     if not font.family() == 'Inter':
-        logging.warning("Font 'Inter' not found. Using system default.")
+        logger.warning("Font 'Inter' not found. Using system default.")
 
-    # Try to connect to the database
+    # Try to connect to the database and set up its schema and sample data
     db_manager = DatabaseManager()
-    if not db_manager.connect():
+    if not (db_manager.connect() and db_manager.create_tables() and db_manager.populate_sample_data()):
         msg_box = QMessageBox()
         msg_box.setWindowTitle("Error")
-        msg_box.setText("Failed to connect to the database. The application cannot start.")
+        msg_box.setText("Failed to set up the database. The application cannot start.")
         msg_box.setIcon(QMessageBox.Icon.Critical)
         msg_box.exec()
         sys.exit(-1)
-        
-    db_manager.create_tables()
-    db_manager.populate_sample_data()
     
     wishlist_manager = WishlistManager()
     
     main_view = MainView()
     controller = AppController(main_view, db_manager, wishlist_manager)
+    app.aboutToQuit.connect(controller.shutdown)
     
     main_view.show()
     
@@ -4,53 +4,220 @@
 import sqlite3
 import json
 import logging
-from passlib.hash import argon2
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from PyQt6.QtCore import pyqtSignal, QThread
+
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True, frozen=True)
+class Pet:
+    """A pet available for adoption. Fields follow the column order of the pets table."""
+    id: int
+    name: str
+    breed: str
+    age: int
+    description: str | None
+    image_path: str | None
+
+@dataclass(slots=True, frozen=True)
+class Service:
+    """A bookable pet service. Fields follow the column order of the services table."""
+    id: int
+    name: str
+    description: str | None
+    price: float | None
+    # Display form of price, formatted once here instead of by every card and dialog
+    price_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'price_text', f"${self.price:.2f}" if self.price is not None else "")
+
+# Column lists matching the Pet and Service fields, so rows can be unpacked positionally
+PET_COLUMNS = "id, name, breed, age, description, image_path"
+JOINED_PET_COLUMNS = "p.id, p.name, p.breed, p.age, p.description, p.image_path"
+SERVICE_COLUMNS = "id, name, description, price"
+
+# Argon2 cost, tunable per machine. Defaults meet OWASP's minimum of 46 MiB with one lane.
+ARGON2_TIME_COST = int(os.environ.get("ONLYPETS_ARGON2_TIME_COST", 3))
+ARGON2_MEMORY_COST = int(os.environ.get("ONLYPETS_ARGON2_MEMORY_COST", 46 * 1024))  # KiB
+# A hash faster than this is cheap enough to brute-force on a GPU
+MIN_HASH_SECONDS = 0.05
+
+# Shared Argon2 hasher, built once rather than per call
+PASSWORD_HASHER = PasswordHasher(time_cost=ARGON2_TIME_COST, memory_cost=ARGON2_MEMORY_COST,
+                                 parallelism=1, hash_len=32, salt_len=16)
+
+# Verified against when a username is unknown, so failed logins take the same time either way.
+# Timing it also tells us what a login costs on this machine.
+_hash_started = time.perf_counter()
+_DUMMY_HASH = PASSWORD_HASHER.hash("onlypets-dummy-password")
+_hash_seconds = time.perf_counter() - _hash_started
+if _hash_seconds < MIN_HASH_SECONDS:
+    logger.warning("Argon2 hashing took %.1f ms; consider raising ONLYPETS_ARGON2_TIME_COST or "
+                   "ONLYPETS_ARGON2_MEMORY_COST.", _hash_seconds * 1000)
+
+# WHERE conditions for get_pets, in the order their parameters are bound
+PET_FILTERS = (
+    "id IN (SELECT rowid FROM pets_fts WHERE pets_fts MATCH ?)",
+    "breed = ?",
+    "age >= ?",
+    "age <= ?",
+)
+# Every combination of PET_FILTERS built once, keyed by a bitmask of the filters in use,
+# so each call reuses the same SQL text and hits the connection's statement cache
+PET_QUERIES = {
+    mask: f"SELECT {PET_COLUMNS} FROM pets" + (
+        " WHERE " + " AND ".join(c for i, c in enumerate(PET_FILTERS) if mask & (1 << i))
+        if mask else "")
+    for mask in range(1 << len(PET_FILTERS))
+}
 
 class DatabaseManager:
     """Handles all SQLite database connections and operations."""
 
+    # Applied once to every new connection. WAL lets the worker read while the other thread writes.
+    CONNECTION_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-20000",  # 20 MB page cache
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA mmap_size=268435456",  # 256 MB
+    )
+    # Usernames with this many failed logins inside the window are refused without hashing
+    MAX_FAILED_LOGINS = 5
+    FAILED_LOGIN_WINDOW = 300  # seconds
+    FAILED_LOGIN_CACHE_SIZE = 1024
+    # Pet and service reads are memoized; only seeding writes to those tables
+    CATALOG_CACHE_SIZE = 128
+
     def __init__(self, db_name="onlypets.db"):
         """Initializes the database manager and creates tables if they don't exist."""
         self.db_name = db_name
-        self.conn = None
+        # One connection per thread, keyed by thread id, reused for every query on that thread
+        self._pool = {}
+        # Each pooled connection's reusable cursor, keyed the same way
+        self._cursors = {}
+        self._pool_lock = threading.Lock()
+        # username -> (failure count, time of first failure), least recently failed first
+        self._failed_logins = OrderedDict()
+        self._catalog_cache = OrderedDict()
+        self._catalog_lock = threading.Lock()
+
+    @property
+    def conn(self):
+        """The calling thread's connection, or None before connect() has been called."""
+        return self.get_conn() if self._pool else None
+
+    @property
+    def cursor(self):
+        """The calling thread's reusable cursor. Consume its results before running the next query."""
+        tid = threading.get_ident()
+        cursor = self._cursors.get(tid)
+        if cursor is None:
+            self.get_conn()
+            cursor = self._cursors[tid]
+        return cursor
+
+    def get_conn(self):
+        """Returns the calling thread's connection, opening it on first use."""
+        tid = threading.get_ident()
+        conn = self._pool.get(tid)
+        if conn is None:
+            # Autocommit mode: writes that must be atomic together use transaction()
+            conn = sqlite3.connect(self.db_name, check_same_thread=False, cached_statements=256,
+                                   isolation_level=None)
+            conn.row_factory = sqlite3.Row  # Allows accessing columns by name
+            for pragma in self.CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            with self._pool_lock:
+                self._pool[tid] = conn
+                self._cursors[tid] = conn.cursor()
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager that runs its block in one BEGIN IMMEDIATE transaction on the calling
+        thread's connection, committing on success and rolling back on error.
+        Nested uses join the outer transaction.
+        """
+        conn = self.get_conn()
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def release_conn(self):
+        """Closes the calling thread's connection, if it has one. Threads call this as they finish."""
+        tid = threading.get_ident()
+        with self._pool_lock:
+            self._cursors.pop(tid, None)
+            conn = self._pool.pop(tid, None)
+        if conn is not None:
+            conn.close()
 
     def connect(self):
         """Establishes a connection to the database."""
         try:
-            self.conn = sqlite3.connect(self.db_name)
-            self.conn.row_factory = sqlite3.Row  # Allows accessing columns by name
-            logging.info("Database connection successful.")
+            self.get_conn()
+            logger.info("Database connection successful.")
             return True
         except sqlite3.Error as e:
-            logging.error(f"Database connection error: {e}")
+            logger.error("Database connection error: %s", e)
             return False
 
     def close(self):
-        """Closes the database connection."""
-        if self.conn:
-            self.conn.close()
-            logging.info("Database connection closed.")
+        """Closes every pooled database connection."""
+        with self._pool_lock:
+            connections = list(self._pool.values())
+            self._pool.clear()
+            self._cursors.clear()
+        for conn in connections:
+            conn.close()
+        if connections:
+            logger.info("Database connection closed.")
 
     def _execute_query(self, query, params=()):
         """Internal helper to execute a query and handle common errors."""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(query, params)
-            self.conn.commit()
-            return cursor
+            return self.cursor.execute(query, params)
         except sqlite3.Error as e:
-            logging.error(f"SQLite query error: {e}")
+            logger.error("SQLite query error: %s", e)
             return None
 
+    def _execute_many(self, query, seq_of_params):
+        """Internal helper to run one statement for every parameter set in a single transaction."""
+        try:
+            with self.transaction() as conn:
+                conn.executemany(query, seq_of_params)
+            return True
+        except sqlite3.Error as e:
+            logger.error("SQLite query error: %s", e)
+            return False
+
     def create_tables(self):
-        """Creates the necessary database tables (pets, services, users, wishlists, adoptions, bookings)."""
+        """
+        Creates the necessary database tables (pets, services, users, wishlists, adoptions, bookings).
+        Returns False, with nothing applied, if any statement fails.
+        """
         if not self.conn:
-            logging.error("Database not connected. Cannot create tables.")
-            return
+            logger.error("Database not connected. Cannot create tables.")
+            return False
 
         queries = [
             """
@@ -101,13 +268,56 @@ class DatabaseManager:
                 booking_date TEXT,
                 FOREIGN KEY (user_id) REFERENCES users(id),
                 FOREIGN KEY (service_id) REFERENCES services(id)
-            );"""
+            );""",
+            # Indexes for the per-user history lookups and the breed filter. The wishlist one is unique,
+            # which is what lets INSERT OR IGNORE skip pets already on a user's wishlist.
+            "DROP INDEX IF EXISTS idx_wishlist_user;",
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_wishlist_user_pet ON user_wishlist(user_id, pet_id);",
+            "CREATE INDEX IF NOT EXISTS idx_adopt_user ON user_adoptions(user_id);",
+            "CREATE INDEX IF NOT EXISTS idx_book_user ON user_bookings(user_id);",
+            "CREATE INDEX IF NOT EXISTS idx_pets_breed ON pets(breed);",
+            # Full-text index over the searchable pet columns, kept in sync by triggers
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS pets_fts USING fts5(
+                name, breed, content='pets', content_rowid='id'
+            );""",
+            """
+            CREATE TRIGGER IF NOT EXISTS pets_fts_insert AFTER INSERT ON pets BEGIN
+                INSERT INTO pets_fts (rowid, name, breed) VALUES (new.id, new.name, new.breed);
+            END;""",
+            """
+            CREATE TRIGGER IF NOT EXISTS pets_fts_delete AFTER DELETE ON pets BEGIN
+                INSERT INTO pets_fts (pets_fts, rowid, name, breed) VALUES ('delete', old.id, old.name, old.breed);
+            END;""",
+            """
+            CREATE TRIGGER IF NOT EXISTS pets_fts_update AFTER UPDATE ON pets BEGIN
+                INSERT INTO pets_fts (pets_fts, rowid, name, breed) VALUES ('delete', old.id, old.name, old.breed);
+                INSERT INTO pets_fts (rowid, name, breed) VALUES (new.id, new.name, new.breed);
+            END;"""
         ]
-        for query in queries:
-            self._execute_query(query)
+        try:
+            existing = {row[0] for row in self.cursor.execute(
+                "SELECT name FROM sqlite_master WHERE name IN ('pets_fts', 'user_wishlist', 'idx_wishlist_user_pet')")}
+            # Statements run on the connection directly so any failure rolls the whole schema back
+            with self.transaction() as conn:
+                if 'user_wishlist' in existing and 'idx_wishlist_user_pet' not in existing:
+                    # Older databases may hold duplicate wishlist rows, which would block the unique index
+                    conn.execute("""
+                        DELETE FROM user_wishlist WHERE id NOT IN (
+                            SELECT MIN(id) FROM user_wishlist GROUP BY user_id, pet_id
+                        )""")
+                for query in queries:
+                    conn.execute(query)
+                if 'pets_fts' not in existing:
+                    # Index pets that were added before the search table existed
+                    conn.execute("INSERT INTO pets_fts (pets_fts) VALUES ('rebuild')")
+            return True
+        except sqlite3.Error as e:
+            logger.error("Failed to create tables: %s", e)
+            return False
 
     def populate_sample_data(self):
-        """Populates the database with initial sample data."""
+        """Populates the database with initial sample data. Returns False, with nothing inserted, on failure."""
         pets_data = [
             ("Buddy", "Golden Retriever", 3, "A friendly and playful dog, loves long walks.", "p1.jpg"),
             ("Whiskers", "Tabby Cat", 2, "An independent cat who enjoys sunbathing.", "p2.jpg"),
@@ -120,8 +330,6 @@ class DatabaseManager:
             ("Zoe", "Dachshund", 6, "A spirited and brave little dog, full of personality.", "p9.jpg"),
             ("Oliver", "Maine Coon", 4, "A large and gentle cat, very affectionate.", "p10.jpg"),
         ]
-        self._execute_query("INSERT OR IGNORE INTO pets (name, breed, age, description, image_path) VALUES (?, ?, ?, ?, ?)", pets_data)
-
         services_data = [
             ("Grooming", "Full grooming service including bath, trim, and nail clipping.", 50.00),
             ("Vet Checkup", "Comprehensive health checkup by a licensed veterinarian.", 75.00),
@@ -129,184 +337,310 @@ class DatabaseManager:
             ("Daycare", "Supervised daily care for your pet while you're away.", 30.00),
             ("Boarding", "Overnight care and comfortable lodging for your pet.", 40.00),
         ]
-        self._execute_query("INSERT OR IGNORE INTO services (name, description, price) VALUES (?, ?, ?)", services_data)
+        try:
+            with self.transaction() as conn:
+                # Explicit ids make the seed idempotent: rows already present conflict on the primary key
+                conn.executemany("INSERT OR IGNORE INTO pets (id, name, breed, age, description, image_path) VALUES (?, ?, ?, ?, ?, ?)",
+                                 [(i, *pet) for i, pet in enumerate(pets_data, start=1)])
+                conn.executemany("INSERT OR IGNORE INTO services (id, name, description, price) VALUES (?, ?, ?, ?)",
+                                 [(i, *service) for i, service in enumerate(services_data, start=1)])
+        except sqlite3.Error as e:
+            logger.error("Failed to populate sample data: %s", e)
+            return False
+        finally:
+            self.invalidate_catalog_cache()
+        return True
 
     def get_pets(self, query=None, filters=None):
         """Fetches a list of pets, optionally with search query and filters."""
-        sql = "SELECT * FROM pets"
+        # "" and None both mean no search, and must share one cache entry
+        query = query or None
+        key = ('pets', query, frozenset(filters.items()) if filters else None)
+        return self._cached(key, lambda: self._query_pets(query, filters))
+
+    def _query_pets(self, query, filters):
+        """Runs the pet query for get_pets."""
+        if not query and not filters:
+            # The unfiltered list is by far the most common request
+            return [Pet(*row) for row in self.cursor.execute(PET_QUERIES[0])]
+
+        filters = filters or {}
+        values = (
+            self._to_fts_query(query) if query else None,
+            filters.get('breed') or None,
+            filters.get('age_min'),
+            filters.get('age_max'),
+        )
+        mask = 0
         params = []
-        where_clauses = []
-
-        if query:
-            where_clauses.append("(name LIKE ? OR breed LIKE ?)")
-            params.extend([f"%{query}%", f"%{query}%"])
-
-        if filters:
-            if filters.get('breed'):
-                where_clauses.append("breed = ?")
-                params.append(filters['breed'])
-            if filters.get('age_min') is not None:
-                where_clauses.append("age >= ?")
-                params.append(filters['age_min'])
-            if filters.get('age_max') is not None:
-                where_clauses.append("age <= ?")
-                params.append(filters['age_max'])
-
-        if where_clauses:
-            sql += " WHERE " + " AND ".join(where_clauses)
-        
-        cursor = self.conn.cursor()
-        cursor.execute(sql, tuple(params))
-        return [dict(row) for row in cursor.fetchall()]
+        for i, value in enumerate(values):
+            if value is not None and value != "":
+                mask |= 1 << i
+                params.append(value)
+        return [Pet(*row) for row in self.cursor.execute(PET_QUERIES[mask], params)]
+
+    @staticmethod
+    def _to_fts_query(text):
+        """Turns free text into an FTS5 query that prefix-matches every word."""
+        words = text.split()
+        return " ".join('"' + word.replace('"', '""') + '"*' for word in words)
 
     def get_services(self, query=None):
         """Fetches a list of services, optionally with a search query."""
-        sql = "SELECT * FROM services"
+        query = query or None
+        return self._cached(('services', query), lambda: self._query_services(query))
+
+    def _query_services(self, query):
+        """Runs the service query for get_services."""
+        sql = f"SELECT {SERVICE_COLUMNS} FROM services"
         params = []
         if query:
             sql += " WHERE name LIKE ?"
             params.append(f"%{query}%")
         
-        cursor = self.conn.cursor()
+        cursor = self.cursor
         cursor.execute(sql, tuple(params))
-        return [dict(row) for row in cursor.fetchall()]
+        return [Service(*row) for row in cursor.fetchall()]
+
+    def get_home_payload(self):
+        """Fetches the full pet and service lists in a single read transaction."""
+        own_transaction = not self.conn.in_transaction
+        if own_transaction:
+            self.conn.execute("BEGIN")
+        try:
+            return {'pets': self.get_pets(), 'services': self.get_services()}
+        finally:
+            if own_transaction:
+                self.conn.commit()
 
     def get_pet_by_id(self, pet_id):
         """Fetches a single pet by its ID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM pets WHERE id = ?", (pet_id,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        def query():
+            row = self.cursor.execute(f"SELECT {PET_COLUMNS} FROM pets WHERE id = ?", (pet_id,)).fetchone()
+            return Pet(*row) if row else None
+        return self._cached(('pet', pet_id), query)
 
     def get_service_by_id(self, service_id):
         """Fetches a single service by its ID."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM services WHERE id = ?", (service_id,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        def query():
+            row = self.cursor.execute(f"SELECT {SERVICE_COLUMNS} FROM services WHERE id = ?", (service_id,)).fetchone()
+            return Service(*row) if row else None
+        return self._cached(('service', service_id), query)
+
+    def _cached(self, key, query):
+        """Returns the memoized result for key, running query() and storing its result on a miss."""
+        with self._catalog_lock:
+            if key in self._catalog_cache:
+                self._catalog_cache.move_to_end(key)
+                return self._catalog_cache[key]
+        result = query()
+        with self._catalog_lock:
+            self._catalog_cache[key] = result
+            if len(self._catalog_cache) > self.CATALOG_CACHE_SIZE:
+                self._catalog_cache.popitem(last=False)
+        return result
+
+    def invalidate_catalog_cache(self):
+        """Drops all memoized pet and service results. Call after writing to either table."""
+        with self._catalog_lock:
+            self._catalog_cache.clear()
 
     def add_user(self, username, email, password):
         """Adds a new user to the database with a hashed password."""
         try:
-            password_hash = argon2.hash(password)
-            self._execute_query("INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)", 
+            password_hash = PASSWORD_HASHER.hash(password)
+            self.cursor.execute("INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)",
                                 (username, email, password_hash))
-            logging.info(f"New user {username} added successfully.")
+            logger.info("New user %s added successfully.", username)
             return True
         except sqlite3.IntegrityError:
-            logging.warning(f"Username or email '{username}' already exists.")
+            logger.warning("Username or email '%s' already exists.", username)
             return False
 
     def verify_user(self, username, password):
         """Verifies a user's password against the stored hash."""
-        cursor = self.conn.cursor()
+        if self._is_login_throttled(username):
+            logger.warning("Too many failed authentication attempts for user: %s", username)
+            return None
+        cursor = self.cursor
         cursor.execute("SELECT id, password_hash FROM users WHERE username = ?", (username,))
         row = cursor.fetchone()
-        if row and argon2.verify(password, row['password_hash']):
-            logging.info(f"User {username} authenticated successfully.")
-            return row['id']
-        logging.warning(f"Failed authentication attempt for user: {username}")
+        try:
+            PASSWORD_HASHER.verify(row['password_hash'] if row else _DUMMY_HASH, password)
+            if row:
+                self._failed_logins.pop(username, None)
+                if PASSWORD_HASHER.check_needs_rehash(row['password_hash']):
+                    # Upgrade hashes made with older parameters while the plaintext is at hand
+                    self._execute_query("UPDATE users SET password_hash = ? WHERE id = ?",
+                                        (PASSWORD_HASHER.hash(password), row['id']))
+                logger.info("User %s authenticated successfully.", username)
+                return row['id']
+        except (VerificationError, InvalidHashError):
+            pass
+        self._record_failed_login(username)
+        logger.warning("Failed authentication attempt for user: %s", username)
         return None
 
+    def _is_login_throttled(self, username):
+        """Returns True if the username has used up its failed attempts for the current window."""
+        entry = self._failed_logins.get(username)
+        if entry is None:
+            return False
+        count, first_failure = entry
+        if time.monotonic() - first_failure > self.FAILED_LOGIN_WINDOW:
+            del self._failed_logins[username]
+            return False
+        return count >= self.MAX_FAILED_LOGINS
+
+    def _record_failed_login(self, username):
+        """Counts a failed login, evicting the least recently failed username when full."""
+        count, first_failure = self._failed_logins.pop(username, (0, time.monotonic()))
+        self._failed_logins[username] = (count + 1, first_failure)
+        if len(self._failed_logins) > self.FAILED_LOGIN_CACHE_SIZE:
+            self._failed_logins.popitem(last=False)
+
+    def get_authenticated_user(self, username, password):
+        """Verifies a user's password and returns their details, or None if it doesn't match."""
+        user_id = self.verify_user(username, password)
+        return self.get_user_by_id(user_id) if user_id else None
+
     def get_user_by_id(self, user_id):
-        """Fetches user details by ID."""
-        cursor = self.conn.cursor()
+        """Fetches user details by ID as a sqlite3.Row, which supports lookups like user['id']."""
+        cursor = self.cursor
         cursor.execute("SELECT id, username, email FROM users WHERE id = ?", (user_id,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        return cursor.fetchone()
 
     def add_to_wishlist(self, user_id, pet_id):
         """Adds a pet to a user's wishlist."""
-        self._execute_query("INSERT OR IGNORE INTO user_wishlist (user_id, pet_id) VALUES (?, ?)", (user_id, pet_id))
+        return self._execute_query("INSERT OR IGNORE INTO user_wishlist (user_id, pet_id) VALUES (?, ?)", (user_id, pet_id)) is not None
+
+    def bulk_add_wishlist(self, user_id, pet_ids):
+        """Adds several pets to a user's wishlist in a single transaction."""
+        return self._execute_many("INSERT OR IGNORE INTO user_wishlist (user_id, pet_id) VALUES (?, ?)",
+                                  [(user_id, pet_id) for pet_id in pet_ids])
 
     def get_wishlist(self, user_id):
         """Retrieves a user's wishlist."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT p.* FROM user_wishlist uw JOIN pets p ON uw.pet_id = p.id WHERE uw.user_id = ?", (user_id,))
-        return [dict(row) for row in cursor.fetchall()]
+        cursor = self.cursor
+        cursor.execute(f"SELECT {JOINED_PET_COLUMNS} FROM user_wishlist uw JOIN pets p ON uw.pet_id = p.id WHERE uw.user_id = ?", (user_id,))
+        return [Pet(*row) for row in cursor.fetchall()]
         
     def add_adopted_pet(self, user_id, pet_id):
         """Adds an adopted pet to a user's history."""
-        self._execute_query("INSERT INTO user_adoptions (user_id, pet_id, adoption_date) VALUES (?, ?, date('now'))", (user_id, pet_id))
+        return self._execute_query("INSERT INTO user_adoptions (user_id, pet_id, adoption_date) VALUES (?, ?, date('now'))", (user_id, pet_id)) is not None
 
     def get_adopted_pets(self, user_id):
         """Retrieves a user's adoption history."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT p.* FROM user_adoptions ua JOIN pets p ON ua.pet_id = p.id WHERE ua.user_id = ?", (user_id,))
-        return [dict(row) for row in cursor.fetchall()]
+        cursor = self.cursor
+        cursor.execute(f"SELECT {JOINED_PET_COLUMNS} FROM user_adoptions ua JOIN pets p ON ua.pet_id = p.id WHERE ua.user_id = ?", (user_id,))
+        return [Pet(*row) for row in cursor.fetchall()]
 
     def add_booking(self, user_id, service_id, booking_date):
         """Adds a service booking to a user's history."""
-        self._execute_query("INSERT INTO user_bookings (user_id, service_id, booking_date) VALUES (?, ?, ?)", (user_id, service_id, booking_date))
+        return self._execute_query("INSERT INTO user_bookings (user_id, service_id, booking_date) VALUES (?, ?, ?)", (user_id, service_id, booking_date)) is not None
 
     def get_user_bookings(self, user_id):
         """Retrieves a user's booking history."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT s.*, ub.booking_date FROM user_bookings ub JOIN services s ON ub.service_id = s.id WHERE ub.user_id = ?", (user_id,))
-        return [dict(row) for row in cursor.fetchall()]
+        cursor = self.cursor
+        cursor.execute("SELECT s.id, s.name, s.price, ub.booking_date FROM user_bookings ub JOIN services s ON ub.service_id = s.id WHERE ub.user_id = ?", (user_id,))
+        return cursor.fetchall()
 
 
 class WishlistManager:
-    """Manages the guest wishlist saved to a local JSON file."""
+    """
+    Manages the guest wishlist saved to a local JSON file.
+    The list is kept in memory once loaded, so the file is only read once.
+    """
     def __init__(self, filename="guest_wishlist.json"):
         self.filename = filename
+        self._wishlist = None  # Loaded from the file on first use
 
     def load_wishlist(self):
-        """Loads a wishlist from a JSON file."""
-        try:
-            with open(self.filename, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        """Returns the wishlist, reading the JSON file the first time."""
+        if self._wishlist is None:
+            try:
+                with open(self.filename, 'r') as f:
+                    self._wishlist = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._wishlist = []
+        return list(self._wishlist)
 
     def save_wishlist(self, wishlist_ids):
-        """Saves a wishlist to a JSON file."""
-        with open(self.filename, 'w') as f:
-            json.dump(wishlist_ids, f)
+        """Saves the wishlist, replacing the JSON file atomically so a crash can't leave it half written."""
+        self._wishlist = list(wishlist_ids)
+        if not self._wishlist:
+            self._remove_file()
+            return
+        tmp_filename = self.filename + ".tmp"
+        with open(tmp_filename, 'w') as f:
+            json.dump(self._wishlist, f, separators=(',', ':'))
+        os.replace(tmp_filename, self.filename)
+
+    def clear(self):
+        """Empties the wishlist and deletes its file if it exists."""
+        self._wishlist = []
+        self._remove_file()
+
+    def _remove_file(self):
+        """Deletes the wishlist file, ignoring a missing file."""
+        try:
+            os.remove(self.filename)
+        except FileNotFoundError:
+            pass
 
 class DataWorker(QThread):
     """
-    Worker thread to perform database operations in the background.
-    This prevents the UI from freezing during I/O operations.
+    Long-lived worker thread that performs database operations in the background.
+    Operations are queued with submit() and run in order on a single thread,
+    so the UI never freezes on I/O and no request is dropped while another runs.
     """
     result_ready = pyqtSignal(str, object)
     error_occurred = pyqtSignal(str, str)
 
-    def __init__(self, db_manager, operation, **kwargs):
+    def __init__(self, db_manager):
         super().__init__()
         self.db = db_manager
-        self.operation = operation
-        self.kwargs = kwargs
+        self.jobs = queue.Queue()
+
+    # Maps each operation to the result type it emits and the call that produces the result
+    OPERATIONS = {
+        'get_pets': ('pets_list', lambda db, kw: db.get_pets(kw.get('query'), kw.get('filters'))),
+        'get_services': ('services_list', lambda db, kw: db.get_services(kw.get('query'))),
+        'get_home_payload': ('home_payload', lambda db, kw: db.get_home_payload()),
+        'verify_user': ('auth_result', lambda db, kw: db.get_authenticated_user(kw['username'], kw['password'])),
+        'add_user': ('signup_result', lambda db, kw: db.add_user(kw['username'], kw['email'], kw['password'])),
+        'get_wishlist': ('wishlist_result', lambda db, kw: db.get_wishlist(kw['user_id'])),
+        'add_to_wishlist': ('wishlist_updated', lambda db, kw: db.add_to_wishlist(kw['user_id'], kw['pet_id'])),
+        'bulk_add_wishlist': ('wishlist_synced', lambda db, kw: db.bulk_add_wishlist(kw['user_id'], kw['pet_ids'])),
+        'add_adopted_pet': ('adoption_completed', lambda db, kw: db.add_adopted_pet(kw['user_id'], kw['pet_id'])),
+        'add_booking': ('booking_completed', lambda db, kw: db.add_booking(kw['user_id'], kw['service_id'], kw['booking_date'])),
+    }
+
+    # Operations that hash or verify passwords; the controller runs these on a separate worker
+    PASSWORD_OPERATIONS = frozenset({'verify_user', 'add_user'})
+
+    def submit(self, operation, **kwargs):
+        """Queues a database operation to be run on the worker thread."""
+        self.jobs.put((operation, kwargs))
+
+    def stop(self):
+        """Asks the worker to exit once the already queued operations are done."""
+        self.jobs.put(None)
 
     def run(self):
-        """Executes the requested database operation."""
+        """Executes queued database operations until stop() is called."""
         try:
-            if self.operation == 'get_pets':
-                data = self.db.get_pets(self.kwargs.get('query'), self.kwargs.get('filters'))
-                self.result_ready.emit('pets_list', data)
-            elif self.operation == 'get_services':
-                data = self.db.get_services(self.kwargs.get('query'))
-                self.result_ready.emit('services_list', data)
-            elif self.operation == 'verify_user':
-                user_id = self.db.verify_user(self.kwargs['username'], self.kwargs['password'])
-                self.result_ready.emit('auth_result', user_id)
-            elif self.operation == 'add_user':
-                success = self.db.add_user(self.kwargs['username'], self.kwargs['email'], self.kwargs['password'])
-                self.result_ready.emit('signup_result', success)
-            elif self.operation == 'get_wishlist':
-                data = self.db.get_wishlist(self.kwargs['user_id'])
-                self.result_ready.emit('wishlist_result', data)
-            elif self.operation == 'add_to_wishlist':
-                self.db.add_to_wishlist(self.kwargs['user_id'], self.kwargs['pet_id'])
-                self.result_ready.emit('wishlist_updated', True)
-            elif self.operation == 'add_adopted_pet':
-                self.db.add_adopted_pet(self.kwargs['user_id'], self.kwargs['pet_id'])
-                self.result_ready.emit('adoption_completed', True)
-            elif self.operation == 'add_booking':
-                self.db.add_booking(self.kwargs['user_id'], self.kwargs['service_id'], self.kwargs['booking_date'])
-                self.result_ready.emit('booking_completed', True)
-            
-        except Exception as e:
-            logging.error(f"Error in DataWorker thread: {e}")
-            self.error_occurred.emit(self.operation, str(e))
-      
+            while True:
+                job = self.jobs.get()
+                if job is None:
+                    break
+                operation, kwargs = job
+                try:
+                    result_type, handler = self.OPERATIONS[operation]
+                    self.result_ready.emit(result_type, handler(self.db, kwargs))
+                except Exception as e:
+                    logger.error("Error in DataWorker thread: %s", e)
+                    self.error_occurred.emit(operation, str(e))
+        finally:
+            # This thread's connection dies with it
+            self.db.release_conn()
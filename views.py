@@ -1,16 +1,26 @@
 # views.py
 # Contains all the UI classes and widgets.
-
-import sys
+#
+# PERF NOTE: the costly work in this module is image decoding and Qt widget construction, layout
+# and painting, all of which happen in C++. There are no numeric Python loops, so JIT compilers such
+# as Numba or Cython have nothing to speed up here. Optimize with the existing tools instead: the
+# shared pixmap cache, shared fonts, reused cards, batched grid fills and frozen repaints.
+
+import functools
+import os
+import re
+from html import escape
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import islice
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QGridLayout, QFrame, QScrollArea, QSizePolicy, QSpacerItem,
-    QStackedWidget, QDialog, QMessageBox, QTabWidget, QFormLayout, QDateEdit,
-    QCalendarWidget, QProgressBar
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QGridLayout, QFrame, QScrollArea, QStackedWidget, QDialog,
+    QTabWidget, QFormLayout, QCalendarWidget, QProgressBar, QTextBrowser
 )
-from PyQt6.QtGui import QPixmap, QIcon, QFont, QFontDatabase, QColor
-from PyQt6.QtCore import Qt, QSize, QPropertyAnimation, QUrl
-from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+from PyQt6.QtGui import QPixmap, QImage, QImageReader, QFont, QColor
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QDate, QEvent, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 
 # Global style sheet for consistent theming
 STYLE_SHEET = """
@@ -22,7 +32,6 @@ QWidget {
 QFrame#main_frame {
     background-color: #F8FAFC;
     border-radius: 20px;
-    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
 }
 #header_frame {
     background-color: #DBEAFE; /* Calming Blue */
@@ -58,7 +67,6 @@ QPushButton {
     padding: 12px 24px;
     border-radius: 12px;
     border: none;
-    transition: background-color 0.3s ease;
 }
 QPushButton:hover {
     background-color: #EA580C; /* Darker Orange on hover */
@@ -102,103 +110,299 @@ QToolTip {
     border: 1px solid #E2E8F0;
     border-radius: 12px;
     padding: 15px;
-    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-}
-#pet_card:hover, #service_card:hover {
-    transform: scale(1.05);
-    box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
 }
 """
 
-class PetCard(QFrame):
-    """A clickable card widget for displaying a pet."""
-    def __init__(self, pet_data, parent=None):
+# STYLE_SHEET without its comments and indentation, so Qt's parser has less to tokenize
+COMPACT_STYLE_SHEET = re.sub(r'\s+', ' ', re.sub(r'/\*.*?\*/', '', STYLE_SHEET, flags=re.DOTALL)).strip()
+
+def apply_global_style(app):
+    """Sets the theme once on the application, so every window and dialog inherits it without re-parsing."""
+    app.setStyleSheet(COMPACT_STYLE_SHEET)
+
+EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+# Colours used from code rather than STYLE_SHEET, created once instead of per widget
+ERROR_COLOR = "#EF4444"
+PLACEHOLDER_COLOR = QColor("#E2E8F0")
+INVALID_FIELD_STYLE = f"border: 2px solid {ERROR_COLOR};"
+ERROR_LABEL_STYLE = f"color: {ERROR_COLOR};"
+
+# Shared fonts, created once by init_fonts() after the QApplication exists
+FONTS = {}
+
+def init_fonts():
+    """Builds the shared QFont objects used by labels across the views."""
+    if FONTS:
+        return
+    FONTS.update({
+        'welcome': QFont("Inter", 24, QFont.Weight.Bold),
+        'card_title': QFont("Inter", 11, QFont.Weight.Bold),
+        'card_caption': QFont("Inter", 9),
+        'heading': QFont("Inter", 18, QFont.Weight.Bold),
+        'subheading': QFont("Inter", 14, QFont.Weight.Bold),
+    })
+
+def heading_label(text, font_key='heading'):
+    """Creates a plain-text title label in a shared font, avoiding the rich-text parser for <h2>/<h3> markup."""
+    label = QLabel(text)
+    label.setTextFormat(Qt.TextFormat.PlainText)
+    label.setFont(FONTS[font_key])
+    return label
+
+def details_browser(rows):
+    """Creates one read-only document listing (caption, text) rows, instead of a rich-text label per row."""
+    browser = QTextBrowser()
+    browser.setFrameShape(QFrame.Shape.NoFrame)
+    browser.setHtml("".join(f"<p><b>{caption}:</b><br>{escape(str(text))}</p>" for caption, text in rows))
+    return browser
+
+@contextmanager
+def updates_frozen(widget):
+    """Suspends repaints of widget for the block, so bulk changes are laid out and painted once."""
+    if not widget.updatesEnabled():
+        # Already frozen by an outer block, which will repaint when it ends
+        yield
+        return
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+@contextmanager
+def grid_filling(layout):
+    """Freezes layout and its widget for a bulk fill, so the grid is laid out and painted once at the end."""
+    if not layout.isEnabled():
+        # An outer block is already filling this grid
+        yield
+        return
+    layout.setEnabled(False)
+    try:
+        with updates_frozen(layout.parentWidget()):
+            yield
+    finally:
+        layout.setEnabled(True)
+        layout.invalidate()
+
+# Scaled pet photos keyed by (image path, width, height), so each one is decoded and scaled once.
+# Least recently used entries are dropped beyond PIXMAP_CACHE_SIZE.
+PIXMAP_CACHE_SIZE = 128
+_PIXMAP_CACHE = OrderedDict()
+# Keys being decoded on the thread pool, and the labels waiting to show each of them
+_DECODING = set()
+_WAITING_LABELS = {}
+
+@functools.lru_cache(maxsize=1)
+def asset_names():
+    """Names of the non-empty files in assets/, listed once so missing photos skip the decoder entirely."""
+    try:
+        with os.scandir('assets') as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file() and entry.stat().st_size)
+    except OSError:
+        return frozenset()
+
+def decode_scaled_image(path, width, height):
+    """Decodes the asset at path straight to a size that fits width x height. Safe off the GUI thread."""
+    if path not in asset_names():
+        # Missing, or one of the empty stand-ins setup_resources() creates
+        return QImage()
+    # Let the decoder produce the display size directly (JPEGs decode at a fraction of full size)
+    reader = QImageReader(f"assets/{path}")
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio))
+    return reader.read()
+
+def pixmap_from_image(image, width, height):
+    """Converts a decoded image to a pixmap, using the placeholder for images that failed to load."""
+    return placeholder_pixmap(width, height) if image.isNull() else QPixmap.fromImage(image)
+
+def cache_pixmap(key, pixmap):
+    """Stores a pixmap, evicting the least recently used one when the cache is full."""
+    _PIXMAP_CACHE[key] = pixmap
+    _PIXMAP_CACHE.move_to_end(key)
+    if len(_PIXMAP_CACHE) > PIXMAP_CACHE_SIZE:
+        _PIXMAP_CACHE.popitem(last=False)
+
+class _ImageDecodeNotifier(QObject):
+    """Lives on the GUI thread and receives images decoded by the pool, which may only become pixmaps there."""
+    image_decoded = pyqtSignal(object, QImage)
+
+    def __init__(self):
+        super().__init__()
+        self.image_decoded.connect(self.on_image_decoded)
+
+    def on_image_decoded(self, key, image):
+        _DECODING.discard(key)
+        pixmap = pixmap_from_image(image, key[1], key[2])
+        cache_pixmap(key, pixmap)
+        for label in _WAITING_LABELS.pop(key, ()):
+            # Dialogs may have closed, and recycled cards moved on to another photo, during the decode
+            if not sip.isdeleted(label) and label.image_key == key:
+                label.setPixmap(pixmap)
+
+_DECODE_NOTIFIER = _ImageDecodeNotifier()
+
+class _ImageDecodeTask(QRunnable):
+    """Decodes one photo on the global thread pool and hands it back to the GUI thread."""
+    def __init__(self, key):
+        super().__init__()
+        self.key = key
+
+    def run(self):
+        _DECODE_NOTIFIER.image_decoded.emit(self.key, decode_scaled_image(*self.key))
+
+def start_decode(key):
+    """Queues a photo for decoding on the thread pool unless it is cached or already queued."""
+    if key not in _PIXMAP_CACHE and key not in _DECODING:
+        _DECODING.add(key)
+        QThreadPool.globalInstance().start(_ImageDecodeTask(key))
+
+def prewarm_images(paths, width, height):
+    """Starts decoding photos that aren't cached yet on background threads, ahead of their cards."""
+    # Past the cache size, later photos would only evict the earlier ones before their cards need them
+    for path in islice(filter(None, paths), PIXMAP_CACHE_SIZE):
+        start_decode((path, width, height))
+
+def set_pixmap_async(label, path, width, height):
+    """Shows the cached photo on label, or the placeholder until the photo is decoded in the background."""
+    if not path:
+        # Nothing to decode, and (None, w, h) is the placeholder's own cache key
+        label.image_key = None
+        label.setPixmap(placeholder_pixmap(width, height))
+        return
+    key = (path, width, height)
+    label.image_key = key
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is not None:
+        _PIXMAP_CACHE.move_to_end(key)
+        label.setPixmap(pixmap)
+        return
+    label.setPixmap(placeholder_pixmap(width, height))
+    waiting = _WAITING_LABELS.setdefault(key, [])
+    if label not in waiting:
+        waiting.append(label)
+    start_decode(key)
+
+def placeholder_pixmap(width, height):
+    """Returns the solid placeholder shown for missing photos, one shared pixmap per size."""
+    key = (None, width, height)
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(width, height)
+        pixmap.fill(PLACEHOLDER_COLOR)
+        cache_pixmap(key, pixmap)
+    return pixmap
+
+class CardFrame(QFrame):
+    """The framed, fixed-size, clickable base shared by every card in the grids."""
+    # Clicks are handled once per grid by MainView.eventFilter, which maps them back to index
+    OBJECT_NAME = ""
+
+    def __init__(self, parent=None):
         super().__init__(parent)
         self.setFrameShape(QFrame.Shape.StyledPanel)
         self.setFrameShadow(QFrame.Shadow.Raised)
-        self.setObjectName("pet_card")
+        self.setObjectName(self.OBJECT_NAME)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setFixedSize(200, 250)
-        self.pet_data = pet_data
+
+class PetCard(CardFrame):
+    """A clickable card widget for displaying a pet."""
+    OBJECT_NAME = "pet_card"
+
+    def __init__(self, pet_data, index=0, parent=None):
+        super().__init__(parent)
 
         layout = QVBoxLayout()
         layout.setSpacing(10)
         layout.setContentsMargins(0, 0, 0, 0)
         
         # Image Placeholder
-        image_label = QLabel()
-        image_label.setPixmap(self.get_image(pet_data['image_path']).scaled(200, 150, Qt.AspectRatioMode.KeepAspectFit))
-        image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        image_label.setObjectName("pet_image")
-        image_label.setAccessibleName(f"Photo of {pet_data['name']}")
-        layout.addWidget(image_label)
-
-        # Pet Info
-        info_widget = QWidget()
-        info_layout = QVBoxLayout(info_widget)
-        info_layout.setContentsMargins(10, 5, 10, 5)
-
-        name_label = QLabel(f"<b>{pet_data['name']}</b>")
-        name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        info_layout.addWidget(name_label)
+        self.image_label = QLabel()
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.image_label.setObjectName("pet_image")
+        layout.addWidget(self.image_label)
+
+        # Pet Info, padded by label margins rather than a wrapper widget
+        self.name_label = QLabel()
+        self.name_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.name_label.setFont(FONTS['card_title'])
+        self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.name_label.setContentsMargins(10, 5, 10, 0)
+        layout.addWidget(self.name_label)
         
-        breed_label = QLabel(f"<small>{pet_data['breed']}</small>")
-        breed_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        info_layout.addWidget(breed_label)
-        
-        layout.addWidget(info_widget)
+        self.breed_label = QLabel()
+        self.breed_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.breed_label.setFont(FONTS['card_caption'])
+        self.breed_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.breed_label.setContentsMargins(10, 0, 10, 5)
+        layout.addWidget(self.breed_label)
         
         self.setLayout(layout)
-        self.setToolTip(f"<b>{pet_data['name']}</b><br><small>Age: {pet_data['age']} years</small><br><small>Breed: {pet_data['breed']}</small><br><br>{pet_data['description']}")
-
-    def get_image(self, path):
-        """Loads an image or returns a placeholder."""
-        try:
-            pixmap = QPixmap(f"assets/{path}")
-            if not pixmap.isNull():
-                return pixmap
-        except Exception as e:
-            pass
-        # Fallback to a placeholder
-        placeholder = QPixmap(200, 150)
-        placeholder.fill(QColor("#E2E8F0"))
-        # Add a simple dog/cat icon
-        # Placeholder for qtawesome or custom icon
-        return placeholder
-
-class ServiceCard(QFrame):
+        self.update_data(pet_data, index)
+
+    def update_data(self, pet_data, index):
+        """Shows another pet in this card, so cards can be reused instead of rebuilt."""
+        self.pet_data = pet_data
+        self.index = index
+        set_pixmap_async(self.image_label, pet_data.image_path, 200, 150)
+        self.image_label.setAccessibleName(f"Photo of {pet_data.name}")
+        self.name_label.setText(pet_data.name)
+        self.breed_label.setText(pet_data.breed)
+        # Built on the first hover instead, since most cards are never hovered
+        self.tooltip_stale = True
+
+    def event(self, event):
+        """Fills in the plain-text tooltip when one is first asked for."""
+        if event.type() == QEvent.Type.ToolTip and self.tooltip_stale:
+            pet_data = self.pet_data
+            self.setToolTip(f"{pet_data.name}\nAge: {pet_data.age} years\nBreed: {pet_data.breed}\n\n{pet_data.description}")
+            self.tooltip_stale = False
+        return super().event(event)
+
+class ServiceCard(CardFrame):
     """A clickable card widget for a service."""
-    def __init__(self, service_data, parent=None):
+    OBJECT_NAME = "service_card"
+
+    def __init__(self, service_data, index=0, parent=None):
         super().__init__(parent)
-        self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setFrameShadow(QFrame.Shadow.Raised)
-        self.setObjectName("service_card")
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.setFixedSize(200, 250)
-        self.service_data = service_data
 
         layout = QVBoxLayout()
         layout.setSpacing(10)
         layout.setContentsMargins(10, 10, 10, 10)
 
         # Service Name
-        name_label = QLabel(f"<b>{service_data['name']}</b>")
-        name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(name_label)
+        self.name_label = QLabel()
+        self.name_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.name_label.setFont(FONTS['card_title'])
+        self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.name_label)
 
         # Service Description
-        desc_label = QLabel(service_data['description'])
-        desc_label.setWordWrap(True)
-        desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(desc_label)
+        self.desc_label = QLabel()
+        self.desc_label.setWordWrap(True)
+        self.desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.desc_label)
 
         # Price
-        price_label = QLabel(f"<br><b>${service_data['price']:.2f}</b>")
-        price_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(price_label)
+        self.price_label = QLabel()
+        self.price_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.price_label.setFont(FONTS['card_title'])
+        self.price_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.price_label)
 
         layout.addStretch()
         self.setLayout(layout)
+        self.update_data(service_data, index)
+
+    def update_data(self, service_data, index):
+        """Shows another service in this card, so cards can be reused instead of rebuilt."""
+        self.service_data = service_data
+        self.index = index
+        self.name_label.setText(service_data.name)
+        self.desc_label.setText(service_data.description)
+        self.price_label.setText(service_data.price_text)
 
 class Breadcrumbs(QFrame):
     """Custom widget for breadcrumb navigation."""
@@ -210,54 +414,126 @@ class Breadcrumbs(QFrame):
         self.setLayout(self.layout)
         self.setObjectName("breadcrumbs")
         self.steps = []
+        # Buttons and the arrows after them, created as needed and hidden rather than deleted
+        self.buttons = []
+        self.arrows = []
     
     def set_steps(self, steps):
         """Sets the breadcrumb steps."""
-        # Clear existing buttons
-        for i in reversed(range(self.layout.count())):
-            widget = self.layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-        
+        steps = list(steps)
+        if steps == self.steps:
+            return
         self.steps = steps
-        for i, step in enumerate(steps):
-            btn = QPushButton(step)
+        while len(self.buttons) < len(steps):
+            btn = QPushButton()
             btn.setObjectName("breadcrumb_btn")
             btn.setFlat(True)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
             self.layout.addWidget(btn)
-            if i < len(steps) - 1:
-                arrow = QLabel(" > ")
-                self.layout.addWidget(arrow)
+            self.buttons.append(btn)
+            arrow = QLabel(" > ")
+            self.layout.addWidget(arrow)
+            self.arrows.append(arrow)
+
+        for i, (btn, arrow) in enumerate(zip(self.buttons, self.arrows)):
+            if i < len(steps):
+                btn.setText(steps[i])
+                btn.show()
+            else:
+                btn.hide()
+            arrow.setVisible(i < len(steps) - 1)
+
+class BrowseView(QWidget):
+    """A searchable, scrolling card grid; the pet and service list views are both one of these."""
+    # Pixels per scroll bar arrow click or wheel step
+    SCROLL_STEP = 40
+
+    def __init__(self, placeholder, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText(placeholder)
+        self.search_btn = QPushButton("Search")
+
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(self.search_input)
+        search_layout.addWidget(self.search_btn)
+        layout.addLayout(search_layout)
+
+        # Scroll area for the cards
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+
+        self.grid_widget = QWidget()
+        self.grid_layout = QGridLayout(self.grid_widget)
+        self.grid_layout.setSpacing(20)
+        self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
+
+        self.scroll_area.setWidget(self.grid_widget)
+        layout.addWidget(self.scroll_area)
+
+        # QScrollArea resets the step whenever it updates its scroll bars, so put ours back each time
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.rangeChanged.connect(lambda minimum, maximum: scroll_bar.setSingleStep(self.SCROLL_STEP))
+
+    def connect_scroll(self, slot):
+        """Calls slot whenever the grid is scrolled or its scrollable range changes."""
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(slot)
+        scroll_bar.rangeChanged.connect(slot)
 
 class MainView(QMainWindow):
     """The main window of the application, managing all sub-views."""
     
+    # Card grids are filled in batches as the user scrolls, so only the
+    # visible rows (plus one batch of lookahead) are ever instantiated.
+    CARD_COLUMNS = 4
+    CARD_BATCH_SIZE = 12
+    CARD_HEIGHT = 250
+    
     # Signals for communicating with the controller
-    navigate_to_pet_details = pyqtSignal(int)
-    navigate_to_service_details = pyqtSignal(int)
+    navigate_to_pet_details = pyqtSignal(object)
+    navigate_to_service_details = pyqtSignal(object)
     search_triggered = pyqtSignal(str)
     filter_triggered = pyqtSignal(dict)
+    # Forwarded from the list views' search widgets, which only exist once a list is first shown
+    pet_search_text_changed = pyqtSignal(str)
+    pet_search_clicked = pyqtSignal()
+    service_search_text_changed = pyqtSignal(str)
+    service_search_clicked = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("OnlyPets - Pet Adoption & Services")
         self.setMinimumSize(800, 600)
-        self.setStyleSheet(STYLE_SHEET)
+        init_fonts()
+        
+        # Records behind the pet and service grids, including those without a card yet
+        self.pet_items = []
+        self.service_items = []
+        
+        # Created on first use by the controller and reused afterwards
+        self.auth_dialog = None
+        self.schedule_dialog = None
+        self.confirmation_dialog = None
         
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
         
-        # Create all views
+        # Card clicks bubble up to their grid widget, where one event filter per grid handles them
+        self._card_click_handlers = {}
+        # Hidden cards taken out of a grid, kept per card class for reuse by the next refill
+        self._card_pools = {PetCard: [], ServiceCard: []}
+
+        # The list views and the dashboard are built the first time they are shown
         self.home_view = self.create_home_view()
-        self.pet_list_view = self.create_pet_list_view()
-        self.service_list_view = self.create_service_list_view()
-        self.user_dashboard_view = self.create_user_dashboard_view()
+        self.pet_list_view = None
+        self.service_list_view = None
+        self.user_dashboard_view = None
         
         self.stacked_widget.addWidget(self.home_view)
-        self.stacked_widget.addWidget(self.pet_list_view)
-        self.stacked_widget.addWidget(self.service_list_view)
-        self.stacked_widget.addWidget(self.user_dashboard_view)
 
         self.setup_ui()
         self.show_home_view()
@@ -309,8 +585,8 @@ class MainView(QMainWindow):
         layout = QVBoxLayout(home_widget)
         
         # Sections for Pets and Services
-        self.pets_section = self.create_section("Adopt a Pet", "See All Pets")
-        self.services_section = self.create_section("Book Services", "See All Services")
+        self.pets_section, self.see_all_pets_btn, self.pets_section_grid = self.create_section("Adopt a Pet", "See All Pets")
+        self.services_section, self.see_all_services_btn, self.services_section_grid = self.create_section("Book Services", "See All Services")
         
         layout.addWidget(self.pets_section)
         layout.addWidget(self.services_section)
@@ -324,7 +600,7 @@ class MainView(QMainWindow):
         layout = QVBoxLayout(dashboard_widget)
         
         self.welcome_label = QLabel("Welcome, User!")
-        self.welcome_label.setFont(QFont("Inter", 24, QFont.Bold))
+        self.welcome_label.setFont(FONTS['welcome'])
         self.welcome_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.welcome_label)
         
@@ -342,7 +618,7 @@ class MainView(QMainWindow):
         frame = QFrame()
         frame_layout = QVBoxLayout(frame)
         
-        section_label = QLabel(f"<h3>{title}</h3>")
+        section_label = heading_label(title, 'subheading')
         frame_layout.addWidget(section_label)
         
         grid = QGridLayout()
@@ -351,13 +627,16 @@ class MainView(QMainWindow):
         return frame
 
     def create_section(self, title, button_text):
-        """Helper to create a browsable section for the home view."""
+        """Helper to create a browsable section for the home view.
+
+        Returns the section frame, its "see all" button and its card grid widget.
+        """
         frame = QFrame()
         layout = QVBoxLayout(frame)
         
         # Header
         header_layout = QHBoxLayout()
-        header_layout.addWidget(QLabel(f"<h2>{title}</h2>"))
+        header_layout.addWidget(heading_label(title))
         header_layout.addStretch()
         view_all_btn = QPushButton(button_text)
         view_all_btn.setObjectName("secondary_btn")
@@ -366,112 +645,158 @@ class MainView(QMainWindow):
 
         # Placeholder grid, will be populated by controller
         grid_widget = QWidget()
-        self.grid_layout = QGridLayout(grid_widget)
-        self.grid_layout.setContentsMargins(0, 0, 0, 0)
-        self.grid_layout.setSpacing(15)
-        self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
+        grid_layout = QGridLayout(grid_widget)
+        grid_layout.setContentsMargins(0, 0, 0, 0)
+        grid_layout.setSpacing(15)
+        grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
         layout.addWidget(grid_widget)
         
-        return frame
+        return frame, view_all_btn, grid_widget
     
     def create_pet_list_view(self):
         """Creates the full pet browsing view."""
-        pet_list_widget = QWidget()
-        layout = QVBoxLayout(pet_list_widget)
-        
-        self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Search for a pet...")
-        self.search_btn = QPushButton("Search")
-        
-        search_layout = QHBoxLayout()
-        search_layout.addWidget(self.search_input)
-        search_layout.addWidget(self.search_btn)
-        layout.addLayout(search_layout)
-
-        # Scroll area for pet cards
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        
-        self.pet_grid_widget = QWidget()
-        self.pet_grid_layout = QGridLayout(self.pet_grid_widget)
-        self.pet_grid_layout.setSpacing(20)
-        self.pet_grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
-
-        scroll_area.setWidget(self.pet_grid_widget)
-        layout.addWidget(scroll_area)
-        
-        return pet_list_widget
+        view = BrowseView("Search for a pet...")
+        view.search_input.textChanged.connect(self.pet_search_text_changed)
+        view.search_btn.clicked.connect(self.pet_search_clicked)
+        view.connect_scroll(self.load_more_pets)
+        self.watch_card_clicks(view.grid_widget, self.on_pet_card_clicked)
+        return view
 
     def create_service_list_view(self):
         """Creates the full service browsing view."""
-        service_list_widget = QWidget()
-        layout = QVBoxLayout(service_list_widget)
-
-        self.service_search_input = QLineEdit()
-        self.service_search_input.setPlaceholderText("Search for a service...")
-        self.service_search_btn = QPushButton("Search")
-
-        search_layout = QHBoxLayout()
-        search_layout.addWidget(self.service_search_input)
-        search_layout.addWidget(self.service_search_btn)
-        layout.addLayout(search_layout)
-
-        # Scroll area for service cards
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-
-        self.service_grid_widget = QWidget()
-        self.service_grid_layout = QGridLayout(self.service_grid_widget)
-        self.service_grid_layout.setSpacing(20)
-        self.service_grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
-
-        scroll_area.setWidget(self.service_grid_widget)
-        layout.addWidget(scroll_area)
-
-        return service_list_widget
+        view = BrowseView("Search for a service...")
+        view.search_input.textChanged.connect(self.service_search_text_changed)
+        view.search_btn.clicked.connect(self.service_search_clicked)
+        view.connect_scroll(self.load_more_services)
+        self.watch_card_clicks(view.grid_widget, self.on_service_card_clicked)
+        return view
     
-    def clear_grid_layout(self, layout):
-        """Helper to clear a grid layout."""
-        if layout is not None:
-            while layout.count():
-                child = layout.takeAt(0)
-                if child.widget() is not None:
-                    child.widget().deleteLater()
-                    
+    def toast(self, message, timeout_ms=2500):
+        """Shows a short, non-modal notification in the status bar."""
+        self.statusBar().showMessage(message, timeout_ms)
+
     def show_home_view(self):
         """Displays the home view."""
         self.stacked_widget.setCurrentWidget(self.home_view)
         
     def show_pet_list_view(self):
-        """Displays the pet list view."""
+        """Displays the pet list view, building it on first use."""
+        if self.pet_list_view is None:
+            self.pet_list_view = self.create_pet_list_view()
+            self.stacked_widget.addWidget(self.pet_list_view)
         self.stacked_widget.setCurrentWidget(self.pet_list_view)
         
     def show_service_list_view(self):
-        """Displays the service list view."""
+        """Displays the service list view, building it on first use."""
+        if self.service_list_view is None:
+            self.service_list_view = self.create_service_list_view()
+            self.stacked_widget.addWidget(self.service_list_view)
         self.stacked_widget.setCurrentWidget(self.service_list_view)
         
     def show_user_dashboard(self, username):
-        """Displays the personalized user dashboard."""
+        """Displays the personalized user dashboard, building it on first use."""
+        if self.user_dashboard_view is None:
+            self.user_dashboard_view = self.create_user_dashboard_view()
+            self.stacked_widget.addWidget(self.user_dashboard_view)
         self.welcome_label.setText(f"Welcome, {username}!")
         self.stacked_widget.setCurrentWidget(self.user_dashboard_view)
 
     def display_pets(self, pet_data_list):
-        """Populates the pet grid with cards."""
-        self.clear_grid_layout(self.pet_grid_layout)
-        col_count = 4
-        for i, pet_data in enumerate(pet_data_list):
-            card = PetCard(pet_data)
-            self.pet_grid_layout.addWidget(card, i // col_count, i % col_count)
+        """Populates the pet grid with the first batch of cards, once the pet list view exists."""
+        # The catalog cache hands back the same list for a repeated query, so returning to the view needn't rebuild its grid
+        unchanged = pet_data_list is self.pet_items
+        self.pet_items = pet_data_list
+        prewarm_images((pet.image_path for pet in pet_data_list), 200, 150)
+        if self.pet_list_view is not None and not (unchanged and self.pet_list_view.grid_layout.count()):
+            self.populate_grid(self.pet_list_view.grid_layout, self.pet_items, PetCard)
 
     def display_services(self, service_data_list):
-        """Populates the service grid with cards."""
-        self.clear_grid_layout(self.service_grid_layout)
-        col_count = 4
-        for i, service_data in enumerate(service_data_list):
-            card = ServiceCard(service_data)
-            self.service_grid_layout.addWidget(card, i // col_count, i % col_count)
+        """Populates the service grid with the first batch of cards, once the service list view exists."""
+        unchanged = service_data_list is self.service_items
+        self.service_items = service_data_list
+        if self.service_list_view is not None and not (unchanged and self.service_list_view.grid_layout.count()):
+            self.populate_grid(self.service_list_view.grid_layout, self.service_items, ServiceCard)
+
+    def populate_grid(self, layout, items, card_class):
+        """Replaces a grid's cards with the first batch for items in a single repaint."""
+        with grid_filling(layout):
+            self.recycle_grid_cards(layout)
+            self.add_card_batch(layout, items, card_class)
+
+    def recycle_grid_cards(self, layout):
+        """Empties a card grid, hiding its cards and keeping them in their class's pool."""
+        while layout.count():
+            card = layout.takeAt(0).widget()
+            if card is not None:
+                card.hide()
+                self._card_pools[type(card)].append(card)
+
+    def add_card_batch(self, layout, items, card_class):
+        """Adds cards for the next batch of items that don't have one yet."""
+        start = layout.count()
+        end = min(start + self.CARD_BATCH_SIZE, len(items))
+        if start >= end:
+            return
+        # Hold off relayouts and repaints until the whole batch is in, so the grid is laid out and painted once
+        pool = self._card_pools[card_class]
+        with grid_filling(layout):
+            for i in range(start, end):
+                row, column = divmod(i, self.CARD_COLUMNS)
+                if pool:
+                    card = pool.pop()
+                    card.update_data(items[i], i)
+                    card.show()
+                else:
+                    card = card_class(items[i], i)
+                layout.addWidget(card, row, column)
+
+    def is_near_scroll_end(self, scroll_area):
+        """Checks whether less than one card row is left below the visible area."""
+        scroll_bar = scroll_area.verticalScrollBar()
+        return scroll_bar.value() >= scroll_bar.maximum() - self.CARD_HEIGHT
+
+    def load_more_pets(self, *args):
+        """Creates more pet cards once the user scrolls close to the end of the grid."""
+        if self.is_near_scroll_end(self.pet_list_view.scroll_area):
+            self.add_card_batch(self.pet_list_view.grid_layout, self.pet_items, PetCard)
+
+    def load_more_services(self, *args):
+        """Creates more service cards once the user scrolls close to the end of the grid."""
+        if self.is_near_scroll_end(self.service_list_view.scroll_area):
+            self.add_card_batch(self.service_list_view.grid_layout, self.service_items, ServiceCard)
+
+    def watch_card_clicks(self, grid_widget, handler):
+        """Routes clicks on grid_widget's cards to handler, called with the card's index."""
+        self._card_click_handlers[grid_widget] = handler
+        grid_widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        """Turns a left click anywhere on a card into its grid's click handler, called with the card's index."""
+        if event.type() in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease) \
+                and event.button() == Qt.MouseButton.LeftButton:
+            handler = self._card_click_handlers.get(watched)
+            card = self.card_at(watched, event.position().toPoint()) if handler else None
+            if card is not None:
+                # Accept the press so the matching release comes back through this filter
+                if event.type() == QEvent.Type.MouseButtonRelease:
+                    handler(card.index)
+                return True
+        return super().eventFilter(watched, event)
+
+    def card_at(self, grid_widget, pos):
+        """Returns the card in grid_widget under pos, or None if pos isn't over a card."""
+        child = grid_widget.childAt(pos)
+        while child is not None and child.parentWidget() is not grid_widget:
+            child = child.parentWidget()
+        return child if isinstance(child, CardFrame) else None
+
+    def on_pet_card_clicked(self, index):
+        """Forwards a pet card click as the pet's record."""
+        self.navigate_to_pet_details.emit(self.pet_items[index])
+
+    def on_service_card_clicked(self, index):
+        """Forwards a service card click as the service's record."""
+        self.navigate_to_service_details.emit(self.service_items[index])
 
 class AuthDialog(QDialog):
     """Modal dialog for user authentication (login/signup)."""
@@ -484,7 +809,6 @@ class AuthDialog(QDialog):
         self.setWindowTitle("Authentication")
         self.setFixedSize(400, 450)
         self.setModal(True)
-        self.setStyleSheet(STYLE_SHEET)
         
         layout = QVBoxLayout(self)
         self.tab_widget = QTabWidget()
@@ -493,98 +817,103 @@ class AuthDialog(QDialog):
         
         layout.addWidget(self.tab_widget)
     
+    # (key, label, placeholder, is password) for each row of the two forms
+    LOGIN_FIELDS = (
+        ('username', "Username:", "Enter your username", False),
+        ('password', "Password:", "Enter your password", True),
+    )
+    SIGNUP_FIELDS = (
+        ('username', "Username:", "Choose a username", False),
+        ('email', "Email:", "Enter your email", False),
+        ('password', "Password:", "Create a password", True),
+    )
+    # (key, check on the stripped text, message when it fails) for live signup validation
+    SIGNUP_RULES = (
+        ('username', bool, "Username cannot be empty."),
+        ('email', EMAIL_RE.match, "Please enter a valid email address."),
+        ('password', lambda text: len(text) >= 6, "Password must be at least 6 characters long."),
+    )
+    # Quiet time after the last keystroke before the signup form is validated
+    VALIDATE_DELAY_MS = 150
+
     def create_login_tab(self):
         """Creates the login form tab."""
-        login_widget = QWidget()
-        form_layout = QFormLayout(login_widget)
-        
-        self.login_username_input = QLineEdit()
-        self.login_username_input.setPlaceholderText("Enter your username")
-        self.login_password_input = QLineEdit()
-        self.login_password_input.setPlaceholderText("Enter your password")
-        self.login_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        
-        login_btn = QPushButton("Login")
-        login_btn.clicked.connect(self.on_login_click)
-        
-        self.login_error_label = QLabel("")
-        self.login_error_label.setStyleSheet("color: #EF4444;")
-        
-        form_layout.addRow("Username:", self.login_username_input)
-        form_layout.addRow("Password:", self.login_password_input)
-        form_layout.addRow("", login_btn)
-        form_layout.addRow("", self.login_error_label)
-        
+        login_widget, self.login_inputs, self.login_error_label = self.build_form(
+            self.LOGIN_FIELDS, "Login", self.on_login_click)
         return login_widget
         
     def create_signup_tab(self):
         """Creates the signup form tab."""
-        signup_widget = QWidget()
-        form_layout = QFormLayout(signup_widget)
-        
-        self.signup_username_input = QLineEdit()
-        self.signup_username_input.setPlaceholderText("Choose a username")
-        self.signup_email_input = QLineEdit()
-        self.signup_email_input.setPlaceholderText("Enter your email")
-        self.signup_password_input = QLineEdit()
-        self.signup_password_input.setPlaceholderText("Create a password")
-        self.signup_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-
-        self.signup_username_input.textChanged.connect(self.validate_signup_form)
-        self.signup_email_input.textChanged.connect(self.validate_signup_form)
-        self.signup_password_input.textChanged.connect(self.validate_signup_form)
-        
-        signup_btn = QPushButton("Sign Up")
-        signup_btn.clicked.connect(self.on_signup_click)
-        
-        self.signup_error_label = QLabel("")
-        self.signup_error_label.setStyleSheet("color: #EF4444;")
-        
-        form_layout.addRow("Username:", self.signup_username_input)
-        form_layout.addRow("Email:", self.signup_email_input)
-        form_layout.addRow("Password:",self.signup_password_input)
-        form_layout.addRow("", signup_btn)
-        form_layout.addRow("", self.signup_error_label)
-
+        signup_widget, self.signup_inputs, self.signup_error_label = self.build_form(
+            self.SIGNUP_FIELDS, "Sign Up", self.on_signup_click)
+        # The error message each signup field currently shows, so styles only change on transitions
+        self.signup_errors = dict.fromkeys(self.signup_inputs, "")
+        self.validate_timer = QTimer(self)
+        self.validate_timer.setSingleShot(True)
+        self.validate_timer.setInterval(self.VALIDATE_DELAY_MS)
+        self.validate_timer.timeout.connect(self.validate_signup_form)
+        for field in self.signup_inputs.values():
+            field.textChanged.connect(lambda text: self.validate_timer.start())
         return signup_widget
 
+    def build_form(self, fields, submit_text, on_submit):
+        """Builds a form tab from field specs. Returns the tab, its inputs by key and its error label."""
+        widget = QWidget()
+        form_layout = QFormLayout(widget)
+        inputs = {}
+        for key, label, placeholder, is_password in fields:
+            field = QLineEdit()
+            field.setPlaceholderText(placeholder)
+            if is_password:
+                field.setEchoMode(QLineEdit.EchoMode.Password)
+            form_layout.addRow(label, field)
+            inputs[key] = field
+
+        submit_btn = QPushButton(submit_text)
+        submit_btn.clicked.connect(on_submit)
+        error_label = QLabel("")
+        error_label.setStyleSheet(ERROR_LABEL_STYLE)
+        form_layout.addRow("", submit_btn)
+        form_layout.addRow("", error_label)
+        return widget, inputs, error_label
+
     def validate_signup_form(self):
         """Performs basic form validation on the fly."""
-        username = self.signup_username_input.text().strip()
-        email = self.signup_email_input.text().strip()
-        password = self.signup_password_input.text().strip()
-
+        self.validate_timer.stop()
         is_valid = True
-
-        if not username:
-            self.signup_username_input.setStyleSheet("border: 2px solid #EF4444;")
-            self.signup_username_input.setToolTip("Username cannot be empty.")
-            is_valid = False
-        else:
-            self.signup_username_input.setStyleSheet("")
-            self.signup_username_input.setToolTip("")
-
-        if not email or "@" not in email:
-            self.signup_email_input.setStyleSheet("border: 2px solid #EF4444;")
-            self.signup_email_input.setToolTip("Please enter a valid email address.")
-            is_valid = False
-        else:
-            self.signup_email_input.setStyleSheet("")
-            self.signup_email_input.setToolTip("")
-
-        if len(password) < 6:
-            self.signup_password_input.setStyleSheet("border: 2px solid #EF4444;")
-            self.signup_password_input.setToolTip("Password must be at least 6 characters long.")
-            is_valid = False
-        else:
-            self.signup_password_input.setStyleSheet("")
-            self.signup_password_input.setToolTip("")
-
+        for key, check, message in self.SIGNUP_RULES:
+            error = "" if check(self.signup_inputs[key].text().strip()) else message
+            if error:
+                is_valid = False
+            self.set_field_error(key, error)
         return is_valid
 
+    def set_field_error(self, key, error):
+        """Highlights a signup field with error, or clears it for "", touching its style only on change."""
+        if self.signup_errors[key] == error:
+            return
+        self.signup_errors[key] = error
+        field = self.signup_inputs[key]
+        field.setStyleSheet(INVALID_FIELD_STYLE if error else "")
+        field.setToolTip(error)
+
+    def clear_inputs(self):
+        """Resets both forms so the dialog can be shown again."""
+        for field in (*self.login_inputs.values(), *self.signup_inputs.values()):
+            # Don't let clearing the signup fields flag them as invalid
+            field.blockSignals(True)
+            field.clear()
+            field.blockSignals(False)
+        self.validate_timer.stop()
+        for key in self.signup_inputs:
+            self.set_field_error(key, "")
+        self.login_error_label.setText("")
+        self.signup_error_label.setText("")
+        self.tab_widget.setCurrentIndex(0)
+
     def on_login_click(self):
-        username = self.login_username_input.text().strip()
-        password = self.login_password_input.text().strip()
+        username = self.login_inputs['username'].text().strip()
+        password = self.login_inputs['password'].text().strip()
         if username and password:
             self.login_attempt.emit(username, password)
         else:
@@ -592,46 +921,49 @@ class AuthDialog(QDialog):
 
     def on_signup_click(self):
         if self.validate_signup_form():
-            username = self.signup_username_input.text().strip()
-            email = self.signup_email_input.text().strip()
-            password = self.signup_password_input.text().strip()
+            username = self.signup_inputs['username'].text().strip()
+            email = self.signup_inputs['email'].text().strip()
+            password = self.signup_inputs['password'].text().strip()
             self.signup_attempt.emit(username, email, password)
         else:
             self.signup_error_label.setText("Please fix the highlighted errors.")
 
 class PetDetailsDialog(QDialog):
     """Modal dialog for displaying detailed pet information."""
-    adopt_pet = pyqtSignal(dict)
+    adopt_pet = pyqtSignal(object)
 
     def __init__(self, pet_data, parent=None):
         super().__init__(parent)
         self.pet_data = pet_data
-        self.setWindowTitle(f"Meet {pet_data['name']}")
+        self.setWindowTitle(f"Meet {pet_data.name}")
         self.setFixedSize(600, 600)
-        self.setStyleSheet(STYLE_SHEET)
 
         layout = QVBoxLayout(self)
 
         info_layout = QHBoxLayout()
         image_label = QLabel()
-        image_label.setPixmap(QPixmap(f"assets/{pet_data['image_path']}").scaled(250, 250, Qt.AspectRatioMode.KeepAspectFit))
-        image_label.setAccessibleName(f"Photo of {pet_data['name']}")
+        set_pixmap_async(image_label, pet_data.image_path, 250, 250)
+        image_label.setAccessibleName(f"Photo of {pet_data.name}")
         info_layout.addWidget(image_label)
 
         details_layout = QVBoxLayout()
-        details_layout.addWidget(QLabel(f"<h2>{pet_data['name']}</h2>"))
-        details_layout.addWidget(QLabel(f"<b>Breed:</b> {pet_data['breed']}"))
-        details_layout.addWidget(QLabel(f"<b>Age:</b> {pet_data['age']} years"))
-        details_layout.addWidget(QLabel(f"<b>Description:</b><br>{pet_data['description']}"))
-        details_layout.addStretch()
+        details_layout.addWidget(heading_label(pet_data.name))
+        details_layout.addWidget(details_browser((
+            ("Breed", pet_data.breed),
+            ("Age", f"{pet_data.age} years"),
+            ("Description", pet_data.description),
+        )))
 
         info_layout.addLayout(details_layout)
         layout.addLayout(info_layout)
 
-        adopt_btn = QPushButton(f"Adopt {pet_data['name']}")
-        adopt_btn.clicked.connect(lambda: self.adopt_pet.emit(self.pet_data))
+        adopt_btn = QPushButton(f"Adopt {pet_data.name}")
+        adopt_btn.clicked.connect(self.on_adopt)
         layout.addWidget(adopt_btn)
 
+    def on_adopt(self):
+        self.adopt_pet.emit(self.pet_data)
+
 class AdoptionFormDialog(QDialog):
     """Modal dialog for the adoption application form."""
     form_submitted = pyqtSignal(dict)
@@ -639,12 +971,11 @@ class AdoptionFormDialog(QDialog):
     def __init__(self, pet_data, parent=None):
         super().__init__(parent)
         self.pet_data = pet_data
-        self.setWindowTitle(f"Adopt {pet_data['name']}")
+        self.setWindowTitle(f"Adopt {pet_data.name}")
         self.setFixedSize(500, 400)
-        self.setStyleSheet(STYLE_SHEET)
 
         layout = QVBoxLayout(self)
-        layout.addWidget(QLabel(f"<h2>Adoption Application for {pet_data['name']}</h2>"))
+        layout.addWidget(heading_label(f"Adoption Application for {pet_data.name}"))
 
         form_layout = QFormLayout()
         self.name_input = QLineEdit()
@@ -666,33 +997,35 @@ class AdoptionFormDialog(QDialog):
             "name": self.name_input.text(),
             "email": self.email_input.text(),
             "reason": self.reason_input.text(),
-            "pet_id": self.pet_data['id']
+            "pet_id": self.pet_data.id
         }
         self.form_submitted.emit(data)
         self.accept()
 
 class ServiceDetailsDialog(QDialog):
     """Modal dialog for a service's details."""
-    book_service = pyqtSignal(dict)
+    book_service = pyqtSignal(object)
 
     def __init__(self, service_data, parent=None):
         super().__init__(parent)
         self.service_data = service_data
-        self.setWindowTitle(f"Service: {service_data['name']}")
+        self.setWindowTitle(f"Service: {service_data.name}")
         self.setFixedSize(500, 400)
-        self.setStyleSheet(STYLE_SHEET)
 
         layout = QVBoxLayout(self)
-        layout.addWidget(QLabel(f"<h2>{service_data['name']}</h2>"))
-        layout.addWidget(QLabel(f"<b>Price:</b> ${service_data['price']:.2f}"))
-        layout.addWidget(QLabel(f"<br><b>Description:</b><br>{service_data['description']}"))
-
-        layout.addStretch()
+        layout.addWidget(heading_label(service_data.name))
+        layout.addWidget(details_browser((
+            ("Price", service_data.price_text),
+            ("Description", service_data.description),
+        )))
 
         book_btn = QPushButton(f"Book This Service")
-        book_btn.clicked.connect(lambda: self.book_service.emit(self.service_data))
+        book_btn.clicked.connect(self.on_book)
         layout.addWidget(book_btn)
 
+    def on_book(self):
+        self.book_service.emit(self.service_data)
+
 class ScheduleDialog(QDialog):
     """Modal dialog for scheduling a service."""
     schedule_selected = pyqtSignal(str)
@@ -701,10 +1034,9 @@ class ScheduleDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Schedule Your Service")
         self.setFixedSize(400, 450)
-        self.setStyleSheet(STYLE_SHEET)
 
         layout = QVBoxLayout(self)
-        layout.addWidget(QLabel("<h2>Select a Date</h2>"))
+        layout.addWidget(heading_label("Select a Date"))
 
         self.calendar = QCalendarWidget()
         layout.addWidget(self.calendar)
@@ -713,6 +1045,10 @@ class ScheduleDialog(QDialog):
         select_btn.clicked.connect(self.on_select)
         layout.addWidget(select_btn)
 
+    def reset(self):
+        """Selects today again so the dialog can be shown for another booking."""
+        self.calendar.setSelectedDate(QDate.currentDate())
+
     def on_select(self):
         selected_date = self.calendar.selectedDate().toString(Qt.DateFormat.ISODate)
         self.schedule_selected.emit(selected_date)
@@ -724,12 +1060,12 @@ class ConfirmationDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Confirmation")
         self.setFixedSize(400, 200)
-        self.setStyleSheet(STYLE_SHEET)
 
         layout = QVBoxLayout(self)
-        label = QLabel(f"<h3 align='center'>{message}</h3>")
-        label.setWordWrap(True)
-        layout.addWidget(label)
+        self.message_label = heading_label(message, 'subheading')
+        self.message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.message_label.setWordWrap(True)
+        layout.addWidget(self.message_label)
 
         ok_btn = QPushButton("OK")
         ok_btn.clicked.connect(self.accept)